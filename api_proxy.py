@@ -6,21 +6,31 @@ READ-ONLY Bunq API access for maximum security
 SECURED with session cookies and rate limiting
 """
 
-from flask import Flask, jsonify, request, Response, session, make_response, send_from_directory, abort
+from flask import Flask, request, Response, session, make_response, send_from_directory, abort, g, has_app_context
 from flask_cors import CORS
 from flask_caching import Cache
-from functools import wraps
+from flask_compress import Compress
+from functools import wraps, lru_cache
 from bunq.sdk.context.api_context import ApiContext
 from bunq.sdk.context.api_environment_type import ApiEnvironmentType
 from bunq.sdk.context.bunq_context import BunqContext
 from bunq.sdk.model.generated import endpoint
 from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, unquote, quote
 import os
+import sys
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import logging.handlers
+import queue
+import atexit
 import hashlib
 import time
+import random
 import sqlite3
 import secrets
 import uuid
@@ -32,7 +42,13 @@ import ipaddress
 import shutil
 import subprocess
 import threading
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, OrderedDict
+
+try:
+    import ahocorasick  # Optional (pyahocorasick): one-pass keyword categorization
+except ImportError:
+    ahocorasick = None
 
 # ============================================
 # LOGGING CONFIGURATION
@@ -42,14 +58,25 @@ APP_DIR = os.path.abspath(os.path.dirname(__file__))
 LOG_DIR = os.path.join(APP_DIR, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
 
+# Request threads only enqueue records; a listener thread does the blocking file/stream writes.
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LOG_OUTPUT_HANDLERS = [
+    logging.FileHandler(os.path.join(LOG_DIR, 'bunq_api.log')),
+    logging.StreamHandler()
+]
+for _log_handler in _LOG_OUTPUT_HANDLERS:
+    _log_handler.setFormatter(_LOG_FORMATTER)
+_LOG_QUEUE = queue.SimpleQueue()
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, *_LOG_OUTPUT_HANDLERS, respect_handler_level=True)
+_LOG_QUEUE_HANDLER = logging.handlers.QueueHandler(_LOG_QUEUE)
+_LOG_QUEUE_HANDLER.setFormatter(logging.Formatter('%(message)s'))  # Full format is applied by the output handlers
+
 logging.basicConfig(
     level=os.getenv('LOG_LEVEL', 'INFO'),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, 'bunq_api.log')),
-        logging.StreamHandler()
-    ]
+    handlers=[_LOG_QUEUE_HANDLER]
 )
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)  # Flush queued records on shutdown
 logger = logging.getLogger(__name__)
 
 def get_int_env(name, default):
@@ -78,7 +105,30 @@ _CREDENTIAL_PASSWORD_IP_LIST_MODE = None
 _CREDENTIAL_PASSWORD_IP_CREATE_MODE = None
 _CREDENTIAL_PASSWORD_IP_UPDATE_MODE = None
 _FX_RUNTIME_CACHE = {}
+_PAYMENT_RUNTIME_CACHE = {}
+_PAYMENT_CACHE_LOCK = threading.Lock()
+_PAYMENT_FETCH_LOCKS = {}
+_ACCOUNT_RUNTIME_CACHE = {}
 _VAULTWARDEN_CLI_LOCK = threading.Lock()
+_API_KEY_CACHE = {'key': None, 'identity': None, 'expires_at': 0.0}
+_API_KEY_CACHE_LOCK = threading.Lock()
+API_KEY_CACHE_SECONDS = get_int_env('API_KEY_CACHE_SECONDS', 600)
+
+def build_http_session(pool_size=4, total_retries=2, backoff_factor=0.2):
+    """Create a keep-alive HTTP session so repeated calls reuse one TCP/TLS connection."""
+    http_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=total_retries, backoff_factor=backoff_factor)
+    )
+    http_session.mount('http://', adapter)
+    http_session.mount('https://', adapter)
+    http_session.headers.update({'Connection': 'keep-alive'})
+    return http_session
+
+# Shared by the token + ciphers calls of the Vaultwarden API path.
+_VAULT_SESSION = build_http_session()
 
 def get_obj_field(obj, *field_names, default=None):
     """Read first non-empty field from objects or dictionaries."""
@@ -180,6 +230,24 @@ def discover_monetary_account_endpoints():
 
     return discovered
 
+def list_account_endpoint(account_endpoint):
+    """
+    account_endpoint.list() values, memoized on flask.g for the current request.
+    list_monetary_accounts and discover_account_type_hints walk the same endpoint classes.
+    """
+    memo = g.setdefault('_bunq_account_lists', {}) if has_app_context() else None
+    key = id(account_endpoint)
+    if memo is not None and key in memo:
+        return memo[key]
+
+    result = account_endpoint.list()
+    accounts = getattr(result, 'value', result)
+    if accounts is None:
+        accounts = []
+    if memo is not None:
+        memo[key] = accounts
+    return accounts
+
 def list_monetary_accounts():
     """Return monetary accounts with bunq-sdk compatibility across versions."""
     global _MONETARY_ACCOUNT_ENDPOINT
@@ -201,10 +269,7 @@ def list_monetary_accounts():
     last_exc = None
     for name, account_endpoint in candidates:
         try:
-            result = account_endpoint.list()
-            accounts = getattr(result, 'value', result)
-            if accounts is None:
-                accounts = []
+            accounts = list_account_endpoint(account_endpoint)
 
             accounts_added = 0
             for account in accounts:
@@ -228,6 +293,21 @@ def list_monetary_accounts():
 
     raise RuntimeError(f"bunq-sdk monetary account list failed: {last_exc}")
 
+def cached_account_lookup(name, loader, use_cache=True):
+    """
+    Short per-process TTL memo (ACCOUNT_CACHE_SECONDS) for account-level Bunq lists.
+    Shared by /api/accounts, /api/transactions and /api/statistics so dashboard polls reuse one listing.
+    """
+    if ACCOUNT_CACHE_SECONDS > 0 and use_cache:
+        entry = _ACCOUNT_RUNTIME_CACHE.get(name)
+        if entry is not None and (time.time() - entry[1]) <= ACCOUNT_CACHE_SECONDS:
+            return entry[0]
+
+    value = loader()
+    if ACCOUNT_CACHE_SECONDS > 0:
+        _ACCOUNT_RUNTIME_CACHE[name] = (value, time.time())
+    return value
+
 def discover_account_type_hints():
     """
     Build account-type hints from endpoint names when available.
@@ -246,11 +326,7 @@ def discover_account_type_hints():
             continue
 
         try:
-            result = account_endpoint.list()
-            accounts = getattr(result, 'value', result)
-            if accounts is None:
-                continue
-            for account in accounts:
+            for account in list_account_endpoint(account_endpoint):
                 account_id = get_obj_field(account, 'id_', 'id')
                 if account_id is None:
                     continue
@@ -488,6 +564,37 @@ def list_payments_for_account(account_id, cutoff_date=None):
 
     raise RuntimeError(f"bunq-sdk payment list failed: {last_exc}")
 
+def get_cached_payments(account_id, cutoff_date=None, use_cache=True):
+    """
+    list_payments_for_account behind a short per-process TTL cache (PAYMENT_CACHE_SECONDS).
+    An entry is reused when it reaches back at least as far as cutoff_date. Concurrent misses for
+    one account wait for a single Bunq fetch instead of each paging through the payments.
+    """
+    if PAYMENT_CACHE_SECONDS <= 0:
+        return list_payments_for_account(account_id, cutoff_date=cutoff_date)
+
+    key = str(account_id)
+    with _PAYMENT_CACHE_LOCK:
+        fetch_lock = _PAYMENT_FETCH_LOCKS.setdefault(key, threading.Lock())
+
+    with fetch_lock:
+        if use_cache:
+            entry = _PAYMENT_RUNTIME_CACHE.get(key)
+            if entry is not None:
+                payments, covered_cutoff, fetched_at = entry
+                fresh = (time.time() - fetched_at) <= PAYMENT_CACHE_SECONDS
+                covers = covered_cutoff is None or (cutoff_date is not None and covered_cutoff <= cutoff_date)
+                if fresh and covers:
+                    return payments
+
+        payments = list_payments_for_account(account_id, cutoff_date=cutoff_date)
+        with _PAYMENT_CACHE_LOCK:
+            _PAYMENT_RUNTIME_CACHE[key] = (payments, cutoff_date, time.time())
+            if len(_PAYMENT_RUNTIME_CACHE) > PAYMENT_CACHE_MAX_ENTRIES:
+                oldest_key = min(_PAYMENT_RUNTIME_CACHE, key=lambda k: _PAYMENT_RUNTIME_CACHE[k][2])
+                _PAYMENT_RUNTIME_CACHE.pop(oldest_key, None)
+        return payments
+
 def _unwrap_endpoint_result(result):
     value = getattr(result, 'value', result)
     if value is None:
@@ -1124,13 +1231,24 @@ def get_vaultwarden_device_identifier():
 app = Flask(__name__)
 STATIC_DIR = APP_DIR
 STATIC_FILES = {'index.html', 'styles.css', 'app.js'}
+STATIC_ASSET_MAX_AGE_SECONDS = get_int_env('STATIC_ASSET_MAX_AGE_SECONDS', 31536000)
+_INDEX_HTML_CACHE = {}
 
 # Simple in-memory cache (per process)
 CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
 CACHE_TTL_SECONDS = get_int_env('CACHE_TTL_SECONDS', 60)
+PAYMENT_CACHE_SECONDS = get_int_env('PAYMENT_CACHE_SECONDS', 30)
+ACCOUNT_CACHE_SECONDS = get_int_env('ACCOUNT_CACHE_SECONDS', 30)
+PAYMENT_CACHE_MAX_ENTRIES = 64
 DEFAULT_PAGE_SIZE = get_int_env('DEFAULT_PAGE_SIZE', 500)
 MAX_PAGE_SIZE = get_int_env('MAX_PAGE_SIZE', 2000)
 MAX_DAYS = get_int_env('MAX_DAYS', 3650)
+# Per-account Bunq fetches are independent HTTPS round trips; one shared pool bounds the fan-out per process
+ACCOUNT_FETCH_MAX_WORKERS = max(1, get_int_env('ACCOUNT_FETCH_MAX_WORKERS', 8))
+_ACCOUNT_FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=ACCOUNT_FETCH_MAX_WORKERS,
+    thread_name_prefix='bunq-account-fetch'
+)
 
 # Local data store for historical analytics (P1)
 DATA_DB_ENABLED = os.getenv('DATA_DB_ENABLED', 'true').lower() == 'true'
@@ -1244,6 +1362,18 @@ cache = Cache(app, config={
     'CACHE_DEFAULT_TIMEOUT': CACHE_TTL_SECONDS
 })
 
+# Response compression for JSON/static assets (Accept-Encoding: br, gzip).
+# Flask-Compress suffixes strong ETags per encoding ("<etag>:br"); see matching_request_etag().
+# Levels trade CPU per response for bytes on the wire (gzip 1-9, brotli 0-11); tiny bodies aren't worth it.
+COMPRESS_ENABLED = get_bool_env('COMPRESS_ENABLED', True)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = get_int_env('COMPRESS_LEVEL', 5)
+app.config['COMPRESS_BR_LEVEL'] = get_int_env('COMPRESS_BR_LEVEL', 4)
+app.config['COMPRESS_MIN_SIZE'] = get_int_env('COMPRESS_MIN_SIZE', 1024)
+app.config['COMPRESS_STREAMING_ENDPOINT_CONDITIONAL'] = ['serve_static']
+if COMPRESS_ENABLED:
+    Compress(app)
+
 # Session configuration - CRITICAL for security
 app.config['SECRET_KEY'] = get_config('FLASK_SECRET_KEY', secrets.token_hex(32), 'flask_secret_key')
 app.config['SESSION_COOKIE_HTTPONLY'] = True  # Prevents JavaScript access
@@ -1293,11 +1423,14 @@ def check_credentials(username, password):
         logger.error("❌ No BASIC_AUTH_PASSWORD set (env or secret)!")
         return False
     
-    # Constant-time comparison to prevent timing attacks
-    username_match = secrets.compare_digest(username, expected_username)
-    password_match = secrets.compare_digest(password, expected_password)
+    if not isinstance(username, str) or not isinstance(password, str):
+        return False
+    
+    # Constant-time comparison on UTF-8 bytes (str input only accepts ASCII); `&` evaluates both
+    username_match = secrets.compare_digest(username.encode('utf-8'), expected_username.encode('utf-8'))
+    password_match = secrets.compare_digest(password.encode('utf-8'), expected_password.encode('utf-8'))
     
-    return username_match and password_match
+    return username_match & password_match
 
 def requires_auth(f):
     """
@@ -1309,7 +1442,7 @@ def requires_auth(f):
         # Check if user is logged in (has valid session)
         if not session.get('authenticated'):
             logger.warning(f"🚫 Unauthorized access attempt from {request.remote_addr}")
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Not authenticated. Please login first.',
                 'login_required': True
@@ -1320,7 +1453,7 @@ def requires_auth(f):
             if datetime.fromisoformat(session['expires_at']) < datetime.now():
                 session.clear()
                 logger.info(f"⏱️  Session expired for {request.remote_addr}")
-                return jsonify({
+                return json_response({
                     'success': False,
                     'error': 'Session expired. Please login again.',
                     'login_required': True
@@ -1334,54 +1467,68 @@ def requires_auth(f):
 # ============================================
 
 class RateLimiter:
-    """Simple in-memory rate limiter"""
+    """
+    Simple in-memory rate limiter (token bucket per client).
+    O(1) per check; at most max_clients buckets per tracker, least recently seen evicted first.
+    """
     
-    def __init__(self, max_requests=30, window_seconds=60):
+    def __init__(self, max_requests=30, window_seconds=60, login_max_requests=5, max_clients=10000):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests = defaultdict(list)
-        self.login_attempts = defaultdict(list)  # Separate tracking for login
+        self.login_max_requests = login_max_requests
+        self.max_clients = max_clients
+        self.requests = OrderedDict()  # client_id -> (tokens, last_refill)
+        self.login_attempts = OrderedDict()  # Separate tracking for login
+        self._lock = threading.Lock()
     
-    def is_allowed(self, client_id, endpoint='general'):
-        """Check if client is allowed to make request"""
-        now = time.time()
-        window_start = now - self.window_seconds
+    def is_allowed(self, client_id, endpoint='general', cost=1):
+        """Check if client may make `cost` requests now; all of them are charged, or none"""
+        now = time.monotonic()
         
-        # Choose appropriate tracking dict
-        tracking = self.login_attempts if endpoint == 'login' else self.requests
-        
-        # Clean old requests
-        tracking[client_id] = [
-            req_time for req_time in tracking[client_id]
-            if req_time > window_start
-        ]
-        
-        # Different limits for login (stricter)
-        max_reqs = 5 if endpoint == 'login' else self.max_requests
-        
-        # Check limit
-        if len(tracking[client_id]) >= max_reqs:
-            return False
+        # Choose appropriate tracking dict; different limits for login (stricter)
+        if endpoint == 'login':
+            tracking, capacity = self.login_attempts, self.login_max_requests
+        else:
+            tracking, capacity = self.requests, self.max_requests
+        refill_per_second = capacity / self.window_seconds
         
-        # Record request
-        tracking[client_id].append(now)
-        return True
+        with self._lock:
+            tokens, last_refill = tracking.get(client_id, (capacity, now))
+            tokens = min(capacity, tokens + (now - last_refill) * refill_per_second)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            tracking[client_id] = (tokens, now)
+            tracking.move_to_end(client_id)
+            while len(tracking) > self.max_clients:
+                tracking.popitem(last=False)
+        return allowed
 
 rate_limiter = RateLimiter(max_requests=30, window_seconds=60)
 
+# WSGI environ flag for in-process /api/batch sub-requests; clients cannot set it (headers become HTTP_*).
+# /api/batch charges their tokens up front, so rate_limit does not charge them again.
+BATCH_DISPATCH_ENVIRON_KEY = 'bunq_dashboard.batch_dispatch'
+
+def rate_limit_exceeded_response(client_id, endpoint):
+    """429 response (and log line) for a client over its rate limit."""
+    logger.warning(f"🚫 Rate limit exceeded for {client_id} on {endpoint}")
+    return json_response({
+        'success': False,
+        'error': 'Rate limit exceeded. Please try again later.'
+    }), 429
+
 def rate_limit(endpoint='general'):
-    """Decorator factory for rate limiting"""
+    """Decorator factory for rate limiting (batch sub-requests are pre-charged by /api/batch)"""
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
             client_id = request.remote_addr
             
+            if request.environ.get(BATCH_DISPATCH_ENVIRON_KEY):
+                return f(*args, **kwargs)
             if not rate_limiter.is_allowed(client_id, endpoint):
-                logger.warning(f"🚫 Rate limit exceeded for {client_id} on {endpoint}")
-                return jsonify({
-                    'success': False,
-                    'error': 'Rate limit exceeded. Please try again later.'
-                }), 429
+                return rate_limit_exceeded_response(client_id, endpoint)
             
             return f(*args, **kwargs)
         return decorated
@@ -1397,13 +1544,129 @@ def cache_allowed():
     cache_param = request.args.get('cache', 'true').lower()
     return cache_param not in ('0', 'false', 'no')
 
+def cache_read_allowed():
+    """Whether cached data may be served; ?refresh=1 skips reads but still stores the fresh result."""
+    return cache_allowed() and not parse_bool(request.args.get('refresh'), default=False)
+
+# Query args that change how a response is delivered, not what it contains.
+CACHE_KEY_IGNORED_ARGS = ('cache', 'refresh', 'stream')
+
 def make_cache_key(prefix):
     user = session.get('username', 'anon')
     args = '&'.join(
-        [f"{k}={v}" for k, v in sorted(request.args.items()) if k != 'cache']
+        [f"{k}={v}" for k, v in sorted(request.args.items()) if k not in CACHE_KEY_IGNORED_ARGS]
     )
     return f"{prefix}:{user}:{args}"
 
+def json_response(payload, status=200):
+    """
+    Serialize with orjson (C encoder); much faster than jsonify for large transaction lists.
+    Types orjson can't encode natively (e.g. Decimal) fall back to Flask's JSON provider.
+    """
+    return app.response_class(encode_json(payload), status=status, mimetype='application/json')
+
+def encode_json(payload):
+    """orjson-encode a payload the same way json_response does."""
+    return orjson.dumps(payload, default=app.json.default, option=orjson.OPT_NON_STR_KEYS)
+
+def streamed_json_response(payload, rows_key='data'):
+    """
+    Stream `payload` with its `rows_key` list encoded row by row (still one valid JSON document).
+    Peak memory no longer includes the full serialized body; no ETag, since the body is never buffered.
+    """
+    rows = payload.get(rows_key) or []
+    head = encode_json({k: v for k, v in payload.items() if k != rows_key})[:-1]
+    key_prefix = (b',' if len(head) > 1 else b'') + encode_json(rows_key) + b':['
+
+    def generate():
+        yield head + key_prefix
+        for index, row in enumerate(rows):
+            yield (b',' if index else b'') + encode_json(row)
+        yield b']}'
+
+    response = app.response_class(generate(), mimetype='application/json')
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+COMPRESSED_ETAG_SUFFIXES = (':br', ':gzip')
+
+def matching_request_etag(etag):
+    """Return the If-None-Match tag matching `etag`, ignoring Flask-Compress encoding suffixes."""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return etag
+    for tag in if_none_match.as_set(include_weak=True):
+        base_tag = tag
+        for suffix in COMPRESSED_ETAG_SUFFIXES:
+            if base_tag.endswith(suffix):
+                base_tag = base_tag[:-len(suffix)]
+                break
+        if base_tag == etag:
+            return tag
+    return None
+
+def body_etag(body):
+    """Strong ETag over an encoded body (blake2b, 16 hex chars)."""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def not_modified_response(etag):
+    """304 (no body) when the client's If-None-Match still matches `etag`, else None."""
+    matched_tag = matching_request_etag(etag)
+    if matched_tag is None:
+        return None
+    not_modified = app.response_class(status=304)
+    not_modified.cache_control.private = True
+    not_modified.cache_control.no_cache = True
+    not_modified.set_etag(matched_tag)
+    return not_modified
+
+def conditional_json_response(payload, etag=None):
+    """
+    JSON response with a strong ETag; private + always revalidated.
+    `payload` may already be encoded (bytes). With a known `etag` a matching revalidation
+    is answered 304 before anything is encoded; otherwise the ETag is taken over the body.
+    The 304 is decided here, before compression, so a revalidation never pays for gzip/brotli.
+    """
+    if etag is not None:
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
+
+    body = payload if isinstance(payload, bytes) else encode_json(payload)
+    if etag is None:
+        etag = body_etag(body)
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
+
+    response = app.response_class(body, mimetype='application/json')
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.set_etag(etag)
+    return response
+
+def cached_json_response(cache_key):
+    """Conditional response from an encoded (body, etag) cache entry; None on a miss or with caching off."""
+    if not cache_read_allowed():
+        return None
+    entry = cache.get(cache_key)
+    if not entry:
+        return None
+    body, etag = entry
+    return conditional_json_response(body, etag)
+
+def cache_json_response(cache_key, payload, etag=None):
+    """
+    Encode `payload` once, keep (body, etag) in the response cache when allowed,
+    and answer conditionally. Cache hits then skip both the rebuild and the serialization.
+    """
+    body = encode_json(payload)
+    etag = etag or body_etag(body)
+    if cache_allowed():
+        cache.set(cache_key, (body, etag), timeout=CACHE_TTL_SECONDS)
+    return conditional_json_response(body, etag)
+
 def parse_pagination():
     """Parse pagination parameters from query string."""
     if 'limit' in request.args or 'offset' in request.args:
@@ -1525,6 +1788,8 @@ def extract_counterparty_name(counterparty_alias):
 
     return 'Unknown'
 
+_OPAQUE_REFERENCE_PATTERN = re.compile(r'[A-Z0-9._:-]{12,}')
+
 def is_opaque_reference_value(value):
     """
     Detect machine-like values that are poor merchant labels
@@ -1540,15 +1805,35 @@ def is_opaque_reference_value(value):
     if normalize_iban(compact):
         return True
 
-    if re.fullmatch(r'[A-Z0-9._:-]{12,}', compact) and ' ' not in text:
+    if _OPAQUE_REFERENCE_PATTERN.fullmatch(compact) and ' ' not in text:
         return True
 
     return False
 
+# Python 3.11+ fromisoformat() parses a trailing 'Z' itself.
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+@lru_cache(maxsize=65536)
+def _parse_bunq_datetime_text(raw):
+    """Memoized parse of one stripped timestamp string (None when invalid); datetimes are immutable."""
+    if not _FROMISOFORMAT_ACCEPTS_Z and raw.endswith('Z'):
+        raw = raw[:-1] + '+00:00'
+
+    try:
+        parsed = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return parsed.astimezone(timezone.utc)
+
 def parse_bunq_datetime(value, context='datetime'):
     """
     Parse bunq datetime strings and always return timezone-aware UTC datetimes.
     Some SDK variants return naive timestamps (without timezone).
+    Every payment is parsed while paging and again when building rows, so the string parse is memoized.
     """
     if value is None:
         return None
@@ -1557,19 +1842,10 @@ def parse_bunq_datetime(value, context='datetime'):
     if not raw:
         return None
 
-    if raw.endswith('Z'):
-        raw = raw[:-1] + '+00:00'
-
-    try:
-        parsed = datetime.fromisoformat(raw)
-    except ValueError:
+    parsed = _parse_bunq_datetime_text(raw)
+    if parsed is None:
         logger.warning(f"⚠️ Invalid {context}: {value!r}; skipping")
-        return None
-
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-
-    return parsed.astimezone(timezone.utc)
+    return parsed
 
 def extract_own_ibans(accounts):
     """Extract own IBANs from Bunq accounts for internal transfer detection."""
@@ -1849,6 +2125,31 @@ def build_transaction_cache_key(transaction):
     ])
     return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
+def build_transaction_cache_row(transaction, captured_at):
+    tx_key = build_transaction_cache_key(transaction)
+    amount = safe_float(transaction.get('amount'), default=0.0, context='transaction amount')
+    currency = (transaction.get('currency') or 'EUR').upper()
+    tx_date = parse_bunq_datetime(transaction.get('date'), context='transaction date')
+    rate_date = tx_date.date().isoformat() if tx_date else None
+    amount_eur, _, _ = convert_amount_to_eur(amount, currency, rate_date=rate_date)
+    return (
+        tx_key,
+        transaction.get('id'),
+        str(transaction.get('account_id')),
+        transaction.get('account_name'),
+        transaction.get('date'),
+        amount,
+        currency,
+        amount_eur,
+        transaction.get('description'),
+        transaction.get('counterparty'),
+        transaction.get('merchant'),
+        transaction.get('category'),
+        transaction.get('type'),
+        1 if transaction.get('is_internal_transfer') else 0,
+        captured_at,
+    )
+
 def persist_transactions(transactions):
     if not DATA_DB_ENABLED or not transactions:
         return
@@ -1859,51 +2160,30 @@ def persist_transactions(transactions):
     captured_at = datetime.now(timezone.utc).isoformat()
 
     try:
+        rows = [build_transaction_cache_row(transaction, captured_at) for transaction in transactions]
         with connection:
-            for transaction in transactions:
-                tx_key = build_transaction_cache_key(transaction)
-                amount = safe_float(transaction.get('amount'), default=0.0, context='transaction amount')
-                currency = (transaction.get('currency') or 'EUR').upper()
-                tx_date = parse_bunq_datetime(transaction.get('date'), context='transaction date')
-                rate_date = tx_date.date().isoformat() if tx_date else None
-                amount_eur, _, _ = convert_amount_to_eur(amount, currency, rate_date=rate_date)
-                connection.execute(
-                    """
-                    INSERT INTO transaction_cache (
-                        tx_key, tx_id, account_id, account_name, tx_date, amount, currency, amount_eur,
-                        description, counterparty, merchant, category, tx_type, is_internal_transfer, captured_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(tx_key) DO UPDATE SET
-                        account_name = excluded.account_name,
-                        amount = excluded.amount,
-                        currency = excluded.currency,
-                        amount_eur = excluded.amount_eur,
-                        description = excluded.description,
-                        counterparty = excluded.counterparty,
-                        merchant = excluded.merchant,
-                        category = excluded.category,
-                        tx_type = excluded.tx_type,
-                        is_internal_transfer = excluded.is_internal_transfer,
-                        captured_at = excluded.captured_at
-                    """,
-                    (
-                        tx_key,
-                        transaction.get('id'),
-                        str(transaction.get('account_id')),
-                        transaction.get('account_name'),
-                        transaction.get('date'),
-                        amount,
-                        currency,
-                        amount_eur,
-                        transaction.get('description'),
-                        transaction.get('counterparty'),
-                        transaction.get('merchant'),
-                        transaction.get('category'),
-                        transaction.get('type'),
-                        1 if transaction.get('is_internal_transfer') else 0,
-                        captured_at,
-                    ),
-                )
+            # One executemany keeps the upsert loop inside sqlite3 instead of one execute() per row.
+            connection.executemany(
+                """
+                INSERT INTO transaction_cache (
+                    tx_key, tx_id, account_id, account_name, tx_date, amount, currency, amount_eur,
+                    description, counterparty, merchant, category, tx_type, is_internal_transfer, captured_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(tx_key) DO UPDATE SET
+                    account_name = excluded.account_name,
+                    amount = excluded.amount,
+                    currency = excluded.currency,
+                    amount_eur = excluded.amount_eur,
+                    description = excluded.description,
+                    counterparty = excluded.counterparty,
+                    merchant = excluded.merchant,
+                    category = excluded.category,
+                    tx_type = excluded.tx_type,
+                    is_internal_transfer = excluded.is_internal_transfer,
+                    captured_at = excluded.captured_at
+                """,
+                rows,
+            )
     except Exception as exc:
         logger.warning(f"⚠️ Failed persisting transactions: {exc}")
     finally:
@@ -1938,7 +2218,7 @@ def login():
         
         if not data or 'username' not in data or 'password' not in data:
             logger.warning(f"🚫 Invalid login request from {request.remote_addr}")
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Username and password required'
             }), 400
@@ -1958,7 +2238,7 @@ def login():
             
             logger.info(f"✅ Successful login: {username} from {request.remote_addr}")
             
-            response = make_response(jsonify({
+            response = make_response(json_response({
                 'success': True,
                 'message': 'Login successful',
                 'username': username,
@@ -1969,14 +2249,14 @@ def login():
         
         else:
             logger.warning(f"🚫 Failed login attempt: {username} from {request.remote_addr}")
-            return jsonify({
+            return json_response({
                 'success': False,
                 'error': 'Invalid username or password'
             }), 401
             
     except Exception as e:
         logger.error(f"❌ Login error: {e}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Login failed'
         }), 500
@@ -1988,7 +2268,7 @@ def logout():
     session.clear()
     logger.info(f"👋 Logout: {username} from {request.remote_addr}")
     
-    return jsonify({
+    return json_response({
         'success': True,
         'message': 'Logged out successfully'
     }), 200
@@ -1997,14 +2277,14 @@ def logout():
 def auth_status():
     """Check if user is authenticated and get session info"""
     if session.get('authenticated'):
-        return jsonify({
+        return json_response({
             'authenticated': True,
             'username': session.get('username'),
             'login_time': session.get('login_time'),
             'expires_at': session.get('expires_at')
         }), 200
     else:
-        return jsonify({
+        return json_response({
             'authenticated': False
         }), 200
 
@@ -2192,14 +2472,14 @@ def get_api_key_from_vaultwarden_api(return_status=False):
             'deviceIdentifier': get_vaultwarden_device_identifier(),
             'deviceName': os.getenv('VAULTWARDEN_DEVICE_NAME', 'Bunq Dashboard').strip()
         }
-        token_response = requests.post(token_url, data=token_data, timeout=10)
+        token_response = _VAULT_SESSION.post(token_url, data=token_data, timeout=10)
         token_response.raise_for_status()
         access_token = token_response.json()['access_token']
         status['token_ok'] = bool(access_token)
 
         logger.info("✅ Vaultwarden authentication successful")
         logger.info(f"🔍 Searching for vault item: '{item_name}'...")
-        items_response = requests.get(
+        items_response = _VAULT_SESSION.get(
             f"{vault_url}/api/ciphers",
             headers={'Authorization': f'Bearer {access_token}'},
             timeout=10
@@ -2245,7 +2525,7 @@ def get_api_key_from_vaultwarden_api(return_status=False):
         logger.error(f"❌ Vaultwarden error: {exc}")
         return None
 
-def get_api_key_from_vaultwarden():
+def fetch_api_key():
     """
     Retrieve Bunq API key with Vaultwarden-first flow.
     Preferred method: Vaultwarden CLI decryption (`VAULTWARDEN_ACCESS_METHOD=cli`).
@@ -2273,6 +2553,50 @@ def get_api_key_from_vaultwarden():
     logger.warning("⚠️ Vaultwarden CLI path failed, trying API fallback")
     return get_api_key_from_vaultwarden_api()
 
+def _api_key_cache_identity():
+    use_vaultwarden = os.getenv('USE_VAULTWARDEN', 'true').lower() == 'true'
+    if not use_vaultwarden:
+        return ('direct',)
+    return (
+        get_vaultwarden_access_method(),
+        os.getenv('VAULTWARDEN_URL', 'http://vaultwarden:80').strip(),
+        get_config('VAULTWARDEN_CLIENT_ID', None, 'vaultwarden_client_id'),
+        os.getenv('VAULTWARDEN_ITEM_NAME', 'Bunq API Key').strip(),
+    )
+
+def invalidate_api_key_cache():
+    """Drop the in-memory API key; returns True when a cached key was present."""
+    with _API_KEY_CACHE_LOCK:
+        had_key = bool(_API_KEY_CACHE.get('key'))
+        _API_KEY_CACHE.update({'key': None, 'identity': None, 'expires_at': 0.0})
+    return had_key
+
+def get_api_key_from_vaultwarden(force_refresh=False):
+    """
+    Return the Bunq API key, reusing a recently retrieved key within API_KEY_CACHE_SECONDS.
+    A vault round-trip (CLI login/unlock or token + ciphers) only happens on a cache miss.
+    """
+    identity = _api_key_cache_identity()
+    with _API_KEY_CACHE_LOCK:
+        if force_refresh:
+            _API_KEY_CACHE.update({'key': None, 'identity': None, 'expires_at': 0.0})
+        elif (
+            _API_KEY_CACHE.get('key')
+            and _API_KEY_CACHE.get('identity') == identity
+            and time.monotonic() < _API_KEY_CACHE.get('expires_at', 0.0)
+        ):
+            logger.info("🔑 Using cached API key (retrieved < %ss ago)", API_KEY_CACHE_SECONDS)
+            return _API_KEY_CACHE['key']
+
+        api_key = fetch_api_key()
+        if api_key and API_KEY_CACHE_SECONDS > 0:
+            _API_KEY_CACHE.update({
+                'key': api_key,
+                'identity': identity,
+                'expires_at': time.monotonic() + API_KEY_CACHE_SECONDS,
+            })
+        return api_key
+
 # ============================================
 # ADMIN/MAINTENANCE HELPERS
 # ============================================
@@ -2280,7 +2604,7 @@ def get_api_key_from_vaultwarden():
 def refresh_api_key():
     """Reload API key according to current auth mode (Vaultwarden preferred)."""
     global API_KEY
-    API_KEY = get_api_key_from_vaultwarden()
+    API_KEY = get_api_key_from_vaultwarden(force_refresh=True)
     return API_KEY
 
 def get_public_egress_ip(timeout_seconds=8):
@@ -2603,6 +2927,12 @@ if ENVIRONMENT_LABEL not in ('PRODUCTION', 'SANDBOX'):
     ENVIRONMENT_LABEL = 'PRODUCTION'
 
 ENVIRONMENT_TYPE = ApiEnvironmentType.SANDBOX if ENVIRONMENT_LABEL == 'SANDBOX' else ApiEnvironmentType.PRODUCTION
+# Background check interval for the shared Bunq session (0 = only the SDK's lazy renewal on the next call)
+BUNQ_SESSION_KEEPALIVE_SECONDS = get_int_env('BUNQ_SESSION_KEEPALIVE_SECONDS', 1500)
+_BUNQ_SESSION_LOCK = threading.Lock()
+_BUNQ_KEEPALIVE_STOP = threading.Event()
+_BUNQ_KEEPALIVE_THREAD = None
+atexit.register(_BUNQ_KEEPALIVE_STOP.set)
 
 # Validate configuration
 if not API_KEY:
@@ -2620,12 +2950,77 @@ if not has_config('FLASK_SECRET_KEY', 'flask_secret_key'):
 # BUNQ API INITIALIZATION
 # ============================================
 
-def init_bunq(force_recreate=False, refresh_key=False, run_auto_whitelist=True):
-    """Initialize Bunq API context with READ-ONLY access."""
-    global API_KEY
+def refresh_bunq_session(api_context=None, min_remaining_seconds=0):
+    """
+    Renew the Bunq session if it expires within `min_remaining_seconds` (at least the SDK's own margin).
+    The new session is built on a copy and saved, so requests in flight keep a valid context and a restart
+    restores a live session. Without `api_context` the shared BunqContext one is checked and the renewed
+    copy is published back to it. Returns the renewed context, or None when no renewal was needed.
+    """
+    with _BUNQ_SESSION_LOCK:
+        publish = api_context is None
+        if publish:
+            api_context = BunqContext.api_context()
+        session_context = api_context.session_context
+        # The SDK tracks expiry as naive local time.
+        expires_soon = not api_context.is_session_active() or (
+            min_remaining_seconds > 0
+            and session_context.expiry_time - datetime.now() <= timedelta(seconds=min_remaining_seconds)
+        )
+        if not expires_soon:
+            return None
+
+        renewed = ApiContext.from_json(api_context.to_json())
+        renewed.reset_session()
+        renewed.save(CONFIG_FILE)
+        if publish:
+            BunqContext.update_api_context(renewed)
+    return renewed
+
+def ensure_bunq_session_for_fan_out():
+    """
+    Renew an expiring shared session in the request thread before work goes to the fetch pool.
+    Otherwise each pool thread's SDK call would reset the same expired session in parallel.
+    """
+    try:
+        refresh_bunq_session()
+    except Exception as e:
+        # The SDK still renews lazily on the first call; a failure here must not fail the request.
+        logger.warning(f"⚠️ Bunq session check before parallel fetch failed: {e}")
+
+def _bunq_session_keepalive_loop():
+    """Renew the shared session ahead of expiry so no request pays the session-server round trip."""
+    while not _BUNQ_KEEPALIVE_STOP.wait(BUNQ_SESSION_KEEPALIVE_SECONDS):
+        try:
+            if refresh_bunq_session(min_remaining_seconds=BUNQ_SESSION_KEEPALIVE_SECONDS + 60):
+                logger.info("🔄 Bunq session renewed ahead of expiry")
+        except Exception as e:
+            logger.warning(f"⚠️ Bunq session keep-alive failed: {e}")
+
+def start_bunq_session_keepalive():
+    """Start the keep-alive daemon thread once per process (BUNQ_SESSION_KEEPALIVE_SECONDS=0 disables it)."""
+    global _BUNQ_KEEPALIVE_THREAD
+
+    if BUNQ_SESSION_KEEPALIVE_SECONDS <= 0:
+        return
+    with _BUNQ_SESSION_LOCK:
+        if _BUNQ_KEEPALIVE_THREAD is not None:
+            return
+        _BUNQ_KEEPALIVE_THREAD = threading.Thread(
+            target=_bunq_session_keepalive_loop,
+            name='bunq-session-keepalive',
+            daemon=True
+        )
+        _BUNQ_KEEPALIVE_THREAD.start()
 
+def init_bunq(force_recreate=False, refresh_key=False, run_auto_whitelist=True, _key_retry=False):
+    """
+    Initialize Bunq API context with READ-ONLY access.
+    refresh_key (admin actions) re-fetches the key from the vault, bypassing the key cache;
+    a failed init with a cached key drops it and retries once with a fresh one.
+    """
     if refresh_key:
-        API_KEY = get_api_key_from_vaultwarden()
+        refresh_api_key()
 
     if not API_KEY:
         logger.warning("⚠️ No API key available, running in demo mode only")
@@ -2653,8 +3048,15 @@ def init_bunq(force_recreate=False, refresh_key=False, run_auto_whitelist=True):
             logger.info("🔄 Restoring existing Bunq API context...")
             api_context = ApiContext.restore(CONFIG_FILE)
             logger.info("✅ Bunq API context restored")
+            # Pre-warm: renew an expired saved session now rather than on the first request.
+            renewed_context = refresh_bunq_session(api_context)
+            if renewed_context is not None:
+                api_context = renewed_context
+                logger.info("🔄 Bunq session renewed and saved")
         
+        # One context for all request and fetch-pool threads; the keep-alive renews it in place.
         BunqContext.load_api_context(api_context)
+        start_bunq_session_keepalive()
         logger.info("✅ Bunq API initialized successfully")
         logger.info(f"   Environment: {ENVIRONMENT_LABEL}")
         logger.info(f"   Access Level: READ-ONLY")
@@ -2686,6 +3088,14 @@ def init_bunq(force_recreate=False, refresh_key=False, run_auto_whitelist=True):
         return True
         
     except Exception as e:
+        if not _key_retry and invalidate_api_key_cache():
+            logger.warning(f"⚠️ Bunq init failed with cached API key, retrying with fresh key: {e}")
+            return init_bunq(
+                force_recreate=force_recreate,
+                refresh_key=True,
+                run_auto_whitelist=run_auto_whitelist,
+                _key_retry=True
+            )
         logger.error(f"❌ Failed to initialize Bunq API: {e}")
         return False
 
@@ -2693,22 +3103,51 @@ def init_bunq(force_recreate=False, refresh_key=False, run_auto_whitelist=True):
 # API ENDPOINTS (PROTECTED)
 # ============================================
 
+def get_static_asset_version(filename):
+    """Short version token from file mtime/size, used to cache-bust asset URLs."""
+    stat = os.stat(os.path.join(STATIC_DIR, filename))
+    return f"{int(stat.st_mtime):x}{stat.st_size:x}"
+
+def render_index_html():
+    """Return index.html bytes with versioned asset URLs (re-rendered only when a file changes)."""
+    versions = tuple(get_static_asset_version(name) for name in ('index.html', 'styles.css', 'app.js'))
+    cached = _INDEX_HTML_CACHE.get('entry')
+    if cached and cached[0] == versions:
+        return cached[1]
+
+    with open(os.path.join(STATIC_DIR, 'index.html'), 'r', encoding='utf-8') as file:
+        html = file.read()
+    html = html.replace('href="styles.css"', f'href="styles.css?v={versions[1]}"')
+    html = html.replace('src="app.js"', f'src="app.js?v={versions[2]}"')
+    body = html.encode('utf-8')
+    _INDEX_HTML_CACHE['entry'] = (versions, body)
+    return body
+
 @app.route('/', methods=['GET'])
 def serve_index():
-    """Serve the dashboard frontend"""
-    return send_from_directory(STATIC_DIR, 'index.html')
+    """Serve the dashboard frontend (always revalidated; 304 when unchanged)"""
+    response = Response(render_index_html(), mimetype='text/html')
+    response.cache_control.no_cache = True
+    response.add_etag()
+    return response.make_conditional(request)
 
 @app.route('/<path:filename>', methods=['GET'])
 def serve_static(filename):
     """Serve static assets for the dashboard"""
-    if filename in STATIC_FILES:
+    if filename not in STATIC_FILES:
+        return abort(404)
+    if filename == 'index.html' or not request.args.get('v'):
+        # Unversioned URL: no-cache + ETag, so the browser revalidates and gets a 304.
         return send_from_directory(STATIC_DIR, filename)
-    return abort(404)
+    # Versioned URL from index.html: content behind it never changes.
+    response = send_from_directory(STATIC_DIR, filename, max_age=STATIC_ASSET_MAX_AGE_SECONDS)
+    response.cache_control.immutable = True
+    return response
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint - NO AUTH REQUIRED"""
-    return jsonify({
+    return json_response({
         'status': 'healthy',
         'timestamp': datetime.now().isoformat(),
         'version': '3.0.0-session-auth',
@@ -2752,7 +3191,7 @@ def get_admin_status():
             'auto_set_bunq_whitelist_deactivate_others': AUTO_SET_BUNQ_WHITELIST_DEACTIVATE_OTHERS,
         }
     }
-    return jsonify(response)
+    return json_response(response)
 
 @app.route('/api/admin/data-quality', methods=['GET'])
 @requires_auth
@@ -2763,20 +3202,20 @@ def get_admin_data_quality():
     summary = build_data_quality_summary(days=days)
 
     if not summary.get('history_store_enabled', False):
-        return jsonify({
+        return json_response({
             'success': False,
             'error': summary.get('error', 'Historical data store disabled'),
             'data': summary
         }), 503
 
     if summary.get('error'):
-        return jsonify({
+        return json_response({
             'success': False,
             'error': summary.get('error', 'Failed to build data quality summary'),
             'data': summary
         }), 500
 
-    return jsonify({
+    return json_response({
         'success': True,
         'data': summary
     })
@@ -2788,12 +3227,12 @@ def get_admin_egress_ip():
     """Return current public egress IP as seen from the dashboard container."""
     public_ip = get_public_egress_ip()
     if not public_ip:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Unable to determine egress IP'
         }), 503
 
-    return jsonify({
+    return json_response({
         'success': True,
         'data': {
             'egress_ip': public_ip
@@ -2816,16 +3255,18 @@ def reinitialize_bunq_context():
     if clear_runtime_cache:
         cache.clear()
         _FX_RUNTIME_CACHE.clear()
+        _PAYMENT_RUNTIME_CACHE.clear()
+        _ACCOUNT_RUNTIME_CACHE.clear()
 
     success = init_bunq(force_recreate=force_recreate, refresh_key=refresh_key)
     if not success:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to reinitialize Bunq API context',
             'api_initialized': False
         }), 500
 
-    return jsonify({
+    return json_response({
         'success': True,
         'message': 'Bunq context reinitialized',
         'data': {
@@ -2859,7 +3300,7 @@ def set_bunq_whitelist_ip():
     try:
         target_ip = validate_ipv4_or_none(target_ip, require_public=True)
     except ValueError as exc:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(exc)
         }), 400
@@ -2867,26 +3308,28 @@ def set_bunq_whitelist_ip():
     if clear_runtime_cache:
         cache.clear()
         _FX_RUNTIME_CACHE.clear()
+        _PAYMENT_RUNTIME_CACHE.clear()
+        _ACCOUNT_RUNTIME_CACHE.clear()
 
     if not init_bunq(
         force_recreate=force_recreate,
         refresh_key=refresh_key,
         run_auto_whitelist=False
     ):
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Bunq API is not initialized'
         }), 500
 
     result = set_bunq_api_whitelist_ip(target_ip=target_ip, deactivate_others=deactivate_others)
     if not result.get('success'):
-        return jsonify({
+        return json_response({
             'success': False,
             'error': result.get('error', 'Failed to set Bunq allowlist IP'),
             'data': result
         }), 500
 
-    return jsonify({
+    return json_response({
         'success': True,
         'message': 'Bunq API allowlist updated',
         'data': result
@@ -2912,13 +3355,13 @@ def run_admin_maintenance():
     try:
         target_ip = validate_ipv4_or_none(target_ip, require_public=True)
     except ValueError as exc:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(exc)
         }), 400
 
     if not auto_target_ip and not target_ip:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'target_ip is required when auto_target_ip=false'
         }), 400
@@ -2929,6 +3372,8 @@ def run_admin_maintenance():
     if clear_runtime_cache:
         cache.clear()
         _FX_RUNTIME_CACHE.clear()
+        _PAYMENT_RUNTIME_CACHE.clear()
+        _ACCOUNT_RUNTIME_CACHE.clear()
         maintenance_steps.append('runtime_cache_cleared')
 
     # Always re-init Bunq context in this maintenance flow (with caller-controlled options).
@@ -2938,7 +3383,7 @@ def run_admin_maintenance():
         run_auto_whitelist=False
     )
     if not initialized:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Failed to initialize Bunq API context',
             'data': {
@@ -2957,7 +3402,7 @@ def run_admin_maintenance():
         deactivate_others=deactivate_others
     )
     if not whitelist_result.get('success'):
-        return jsonify({
+        return json_response({
             'success': False,
             'error': whitelist_result.get('error', 'Failed to update Bunq allowlist IP'),
             'data': {
@@ -2969,7 +3414,7 @@ def run_admin_maintenance():
     resolved_target_ip = whitelist_result.get('target_ip')
     maintenance_steps.append('bunq_whitelist_updated')
 
-    return jsonify({
+    return json_response({
         'success': True,
         'message': 'Admin maintenance completed',
         'data': {
@@ -2996,21 +3441,22 @@ def run_admin_maintenance():
 def get_accounts():
     """Get all Bunq accounts (READ-ONLY) - SESSION AUTH REQUIRED"""
     if not API_KEY:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Demo mode - configure API key'
         }), 503
     
     try:
         cache_key = make_cache_key('accounts')
-        if cache_allowed():
-            cached = cache.get(cache_key)
-            if cached:
-                return jsonify(cached)
+        cached = cached_json_response(cache_key)
+        if cached is not None:
+            return cached
         
         logger.info(f"📊 Fetching accounts for {session.get('username')}")
-        accounts = list_monetary_accounts()
-        account_type_hints = discover_account_type_hints()
+        use_cache = cache_read_allowed()
+        accounts = cached_account_lookup('monetary_accounts', list_monetary_accounts, use_cache)
+        # Served from the per-request endpoint lists that list_monetary_accounts just fetched.
+        account_type_hints = cached_account_lookup('account_type_hints', discover_account_type_hints, use_cache)
         
         accounts_data = []
         for account in accounts:
@@ -3068,14 +3514,11 @@ def get_accounts():
             'count': len(accounts_data)
         }
         
-        if cache_allowed():
-            cache.set(cache_key, response, timeout=CACHE_TTL_SECONDS)
-        
-        return jsonify(response)
+        return cache_json_response(cache_key, response)
         
     except Exception as e:
         logger.exception(f"❌ Error fetching accounts: {e}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -3086,7 +3529,7 @@ def get_accounts():
 def get_transactions():
     """Get transactions - SESSION AUTH REQUIRED"""
     if not API_KEY:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Demo mode - configure API key'
         }), 503
@@ -3099,16 +3542,18 @@ def get_transactions():
         sort_desc = sort == 'desc'
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
         exclude_internal = parse_bool(request.args.get('exclude_internal'), default=False)
+        # Opt-in: stream the rows instead of buffering the whole JSON body (large histories).
+        stream = parse_bool(request.args.get('stream'), default=False)
         
         cache_key = make_cache_key('transactions')
-        if cache_allowed():
-            cached = cache.get(cache_key)
-            if cached:
-                return jsonify(cached)
+        # A cached body is already in memory, so it is served as-is even when streaming was asked for.
+        cached = cached_json_response(cache_key)
+        if cached is not None:
+            return cached
         
         logger.info(f"📊 Fetching transactions (last {days} days) for {session.get('username')}")
         
-        accounts = list_monetary_accounts()
+        accounts = cached_account_lookup('monetary_accounts', list_monetary_accounts, cache_read_allowed())
         accounts_by_id = {}
         for acc in accounts:
             acc_id = get_obj_field(acc, 'id_', 'id')
@@ -3127,17 +3572,12 @@ def get_transactions():
         else:
             selected_accounts = accounts
         
-        all_transactions = []
-        for account in selected_accounts:
-            account_id_value = get_obj_field(account, 'id_', 'id')
-            transactions = get_account_transactions(
-                account_id_value,
-                cutoff_date,
-                sort_desc,
-                own_ibans,
-                get_obj_field(account, 'description', 'display_name')
-            )
-            all_transactions.extend(transactions)
+        all_transactions = fetch_transactions_for_accounts(
+            selected_accounts,
+            cutoff_date,
+            own_ibans,
+            use_cache=cache_read_allowed()
+        )
         
         if exclude_internal:
             all_transactions = [t for t in all_transactions if not t.get('is_internal_transfer')]
@@ -3157,22 +3597,50 @@ def get_transactions():
             'sort': sort
         }
         
-        if cache_allowed():
-            cache.set(cache_key, response, timeout=CACHE_TTL_SECONDS)
-        
-        return jsonify(response)
+        if stream:
+            # Not cached: caching would mean encoding the full body, which streaming avoids.
+            return streamed_json_response(response)
+        return cache_json_response(cache_key, response)
             
     except Exception as e:
         logger.exception(f"❌ Error fetching transactions: {e}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
 
-def get_account_transactions(account_id, cutoff_date=None, sort_desc=True, own_ibans=None, account_name=None):
-    """Get transactions for specific account"""
-    payments = list_payments_for_account(account_id, cutoff_date=cutoff_date)
-    transactions = []
+def fetch_transactions_for_accounts(accounts, cutoff_date=None, own_ibans=None, use_cache=True):
+    """
+    Fetch transactions for several accounts concurrently (one Bunq round trip chain per account).
+    Results keep the order of `accounts`; the first failure is re-raised like the sequential loop did.
+    """
+    accounts = list(accounts)
+    if not accounts:
+        return []
+
+    def fetch(account):
+        return get_account_transactions(
+            get_obj_field(account, 'id_', 'id'),
+            cutoff_date,
+            own_ibans,
+            get_obj_field(account, 'description', 'display_name'),
+            use_cache=use_cache
+        )
+
+    if len(accounts) == 1:
+        return fetch(accounts[0])
+
+    ensure_bunq_session_for_fan_out()
+    all_transactions = []
+    for transactions in _ACCOUNT_FETCH_EXECUTOR.map(fetch, accounts):
+        all_transactions.extend(transactions)
+    return all_transactions
+
+def iter_categorized_payments(payments, cutoff_date=None, own_ibans=None):
+    """
+    Parse and categorize Bunq payments down to the cutoff, lazily.
+    Yields (payment, payment_id, created, amount, currency, description, counterparty_name, category, is_internal).
+    """
     own_ibans = own_ibans or set()
     
     for payment in payments:
@@ -3189,10 +3657,10 @@ def get_account_transactions(account_id, cutoff_date=None, sort_desc=True, own_i
             logger.warning(f"⚠️ Payment {payment_id} has invalid created timestamp; skipping")
             continue
 
+        # Bunq lists payments newest-first (paged via older_id), so everything after this is older too;
+        # the requested sort order is applied later on the merged list.
         if cutoff_date and created < cutoff_date:
-            if sort_desc:
-                break
-            continue
+            break
         
         is_internal_transfer = False
         counterparty_alias = get_obj_field(payment, 'counterparty_alias', 'counterparty')
@@ -3206,7 +3674,6 @@ def get_account_transactions(account_id, cutoff_date=None, sort_desc=True, own_i
             get_obj_field(payment, 'amount', 'monetary_value'),
             context=f"payment {payment_id} amount"
         )
-        merchant_reference = get_obj_field(payment, 'merchant_reference', 'merchant_reference_')
         merchant_category_code = get_obj_field(counterparty_alias, 'merchant_category_code')
         category = categorize_transaction(
             description,
@@ -3215,6 +3682,21 @@ def get_account_transactions(account_id, cutoff_date=None, sort_desc=True, own_i
             merchant_category_code=merchant_category_code,
             amount=amount_value
         )
+        yield (
+            payment, payment_id, created, amount_value, amount_currency,
+            description, counterparty_name, category, is_internal_transfer
+        )
+
+def get_account_transactions(account_id, cutoff_date=None, own_ibans=None, account_name=None, use_cache=True):
+    """Get transactions for specific account"""
+    payments = get_cached_payments(account_id, cutoff_date=cutoff_date, use_cache=use_cache)
+    transactions = []
+    
+    for (
+        payment, payment_id, created, amount_value, amount_currency,
+        description, counterparty_name, category, is_internal_transfer
+    ) in iter_categorized_payments(payments, cutoff_date, own_ibans):
+        merchant_reference = get_obj_field(payment, 'merchant_reference', 'merchant_reference_')
         merchant_candidates = [counterparty_name, description, merchant_reference]
         merchant_label = next(
             (
@@ -3247,95 +3729,180 @@ def get_account_transactions(account_id, cutoff_date=None, sort_desc=True, own_i
     
     return transactions
 
-def categorize_transaction(description, counterparty_name, is_internal=False, merchant_category_code=None, amount=None):
-    """Rule-based categorization with MCC fallback."""
-    if is_internal:
-        return 'Internal Transfer'
+def iter_transaction_stats(accounts, cutoff_date=None, own_ibans=None, use_cache=True):
+    """
+    Only what /api/statistics needs, without building per-transaction dicts:
+    yields (account_id, payment_id, amount, category, is_internal) in account order.
+    Payment lists are fetched concurrently like fetch_transactions_for_accounts.
+    """
+    account_ids = [get_obj_field(account, 'id_', 'id') for account in accounts]
+    if not account_ids:
+        return
 
-    desc_lower = description.lower() if description else ''
-    counter_lower = counterparty_name.lower() if counterparty_name else ''
-    combined = f"{desc_lower} {counter_lower}".strip()
-    try:
-        amount_value = 0.0 if amount is None else float(amount)
-    except (TypeError, ValueError):
-        amount_value = 0.0
+    def fetch(account_id):
+        return get_cached_payments(account_id, cutoff_date=cutoff_date, use_cache=use_cache)
 
-    mcc = str(merchant_category_code or '').strip()
-    if mcc:
-        if mcc in {'5411', '5422', '5441', '5451', '5462', '5499'}:
-            return 'Boodschappen'
-        if mcc in {'5812', '5813', '5814'}:
-            return 'Horeca'
-        if mcc in {'4111', '4121', '4789', '5541', '5542'}:
-            return 'Vervoer'
-        if mcc in {'4900', '4814'}:
-            return 'Utilities'
-        if mcc in {'5960', '5966', '6300'}:
-            return 'Verzekering'
-        if mcc in {'9211', '9311', '9399'}:
-            return 'Belastingen'
-        if mcc in {'5912', '8011', '8021', '8099'}:
-            return 'Zorg'
-        if mcc in {'7832', '7922', '7997', '7999'}:
-            return 'Entertainment'
-        if mcc in {'5311', '5331', '5399', '5651', '5732'}:
-            return 'Shopping'
+    if len(account_ids) == 1:
+        payment_lists = [fetch(account_ids[0])]
+    else:
+        ensure_bunq_session_for_fan_out()
+        payment_lists = list(_ACCOUNT_FETCH_EXECUTOR.map(fetch, account_ids))
+
+    for account_id, payments in zip(account_ids, payment_lists):
+        for _, payment_id, _, amount, _, _, _, category, is_internal in iter_categorized_payments(
+            payments, cutoff_date, own_ibans
+        ):
+            yield account_id, payment_id, amount, category, is_internal
+
+MCC_CATEGORY_RULES = (
+    ('Boodschappen', ('5411', '5422', '5441', '5451', '5462', '5499')),
+    ('Horeca', ('5812', '5813', '5814')),
+    ('Vervoer', ('4111', '4121', '4789', '5541', '5542')),
+    ('Utilities', ('4900', '4814')),
+    ('Verzekering', ('5960', '5966', '6300')),
+    ('Belastingen', ('9211', '9311', '9399')),
+    ('Zorg', ('5912', '8011', '8021', '8099')),
+    ('Entertainment', ('7832', '7922', '7997', '7999')),
+    ('Shopping', ('5311', '5331', '5399', '5651', '5732')),
+)
+MCC_CATEGORY_MAP = {
+    mcc: category
+    for category, mcc_codes in MCC_CATEGORY_RULES
+    for mcc in mcc_codes
+}
+
+# Keyword rules in priority order: the first category with any substring hit wins.
+INCOME_CATEGORY_RULES = (
+    ('Refund', ('refund', 'terugbetaling', 'chargeback', 'retour', 'reversal')),
+    ('Rente', ('rente', 'interest')),
+    ('Salaris', ('salaris', 'salary', 'loon', 'wage')),
+)
 
-    if amount_value > 0:
-        if any(word in combined for word in ['refund', 'terugbetaling', 'chargeback', 'retour', 'reversal']):
-            return 'Refund'
-        if any(word in combined for word in ['rente', 'interest']):
-            return 'Rente'
-        if any(word in combined for word in ['salaris', 'salary', 'loon', 'wage']):
-            return 'Salaris'
-
-    if any(word in combined for word in [
+CATEGORY_KEYWORD_RULES = (
+    ('Boodschappen', (
         'albert heijn', ' ah ', 'jumbo', 'lidl', 'aldi', 'plus', 'dirk',
         'picnic', 'ekoplaza', 'spar ', 'coop', 'supermarkt', 'carrefour',
         'dekamarkt', 'hoogvliet', 'vomar', 'poiesz', 'jan linders', 'appie'
-    ]):
-        return 'Boodschappen'
-    elif any(word in combined for word in [
+    )),
+    ('Horeca', (
         'restaurant', 'cafe', 'bar', 'pizza', 'burger', 'starbucks',
         'thuisbezorgd', 'ubereats', 'deliveroo', 'mcdonald', 'kfc', 'subway'
-    ]):
-        return 'Horeca'
-    elif any(word in combined for word in [
+    )),
+    ('Vervoer', (
         'ns ', 'train', 'bus', 'taxi', 'uber', 'ov ', 'parking',
         'q-park', 'shell', 'texaco', 'esso', 'total', 'benzine',
         'ov-chip', 'ovchip', 'arriva', 'connexxion', 'ret ', 'gvb', 'qbuzz'
-    ]):
-        return 'Vervoer'
-    elif any(word in combined for word in ['huur', 'rent', 'hypotheek', 'mortgage', 'vve']):
-        return 'Wonen'
-    elif any(word in combined for word in ['verzekering', 'insur', 'aegon', 'allianz', 'ohra', 'unive', 'zilveren kruis']):
-        return 'Verzekering'
-    elif any(word in combined for word in ['belasting', 'belastingdienst', 'tax', 'gemeente', 'waterschap']):
-        return 'Belastingen'
-    elif any(word in combined for word in [
+    )),
+    ('Wonen', ('huur', 'rent', 'hypotheek', 'mortgage', 'vve')),
+    ('Verzekering', ('verzekering', 'insur', 'aegon', 'allianz', 'ohra', 'unive', 'zilveren kruis')),
+    ('Belastingen', ('belasting', 'belastingdienst', 'tax', 'gemeente', 'waterschap')),
+    ('Utilities', (
         'eneco', 'essent', 'energie', 'gas', 'water', 'ziggo', 'kpn', 'telecom',
         'odido', 'vodafone', 't-mobile', 'tele2', 'youfone', 'hollandsnieuwe'
-    ]):
-        return 'Utilities'
-    elif any(word in combined for word in [
+    )),
+    ('Shopping', (
         'bol.com', 'coolblue', 'mediamarkt', 'amazon', 'zara', 'h&m', 'shop',
         'hema', 'action', 'ikea', 'primark', 'kruidvat', 'etos', 'zalando'
-    ]):
-        return 'Shopping'
-    elif any(word in combined for word in [
+    )),
+    ('Entertainment', (
         'netflix', 'spotify', 'youtube', 'cinema', 'pathé', 'concert', 'steam',
         'nintendo', 'playstation', 'xbox', 'disney+'
-    ]):
-        return 'Entertainment'
-    elif any(word in combined for word in [
+    )),
+    ('Zorg', (
         'apotheek', 'pharmacy', 'dokter', 'doctor', 'tandarts', 'dentist',
         'huisarts', 'ziekenhuis', 'hospital', 'zorgverzekeraar'
-    ]):
-        return 'Zorg'
-    elif any(word in combined for word in ['salaris', 'salary', 'loon', 'wage']):
-        return 'Salaris'
-    else:
-        return 'Overig'
+    )),
+    ('Salaris', ('salaris', 'salary', 'loon', 'wage')),
+)
+
+def flatten_category_rules(rules):
+    """Flatten ordered rules to (keyword, category) pairs; the first hit keeps rule priority."""
+    return tuple(
+        (keyword, category)
+        for category, keywords in rules
+        for keyword in keywords
+    )
+
+def build_keyword_automaton(keyword_categories):
+    """
+    Aho-Corasick automaton over (keyword, category) pairs, or None without pyahocorasick.
+    Each keyword stores its table position, so the lowest position among all hits is the rule-order winner.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (keyword, category) in enumerate(keyword_categories):
+        if keyword not in automaton:
+            automaton.add_word(keyword, (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+_INCOME_KEYWORD_CATEGORIES = flatten_category_rules(INCOME_CATEGORY_RULES)
+_KEYWORD_CATEGORIES = flatten_category_rules(CATEGORY_KEYWORD_RULES)
+_INCOME_KEYWORD_AUTOMATON = build_keyword_automaton(_INCOME_KEYWORD_CATEGORIES)
+_KEYWORD_AUTOMATON = build_keyword_automaton(_KEYWORD_CATEGORIES)
+
+def match_category_keywords(keyword_categories, text, automaton=None):
+    """First category (in rule order) with a keyword in `text`; one automaton pass when available."""
+    if automaton is not None:
+        best = None
+        for _, (priority, category) in automaton.iter(text):
+            if best is None or priority < best[0]:
+                best = (priority, category)
+                if priority == 0:
+                    break
+        return best[1] if best else None
+
+    for keyword, category in keyword_categories:
+        if keyword in text:
+            return category
+    return None
+
+def categorize_transaction(description, counterparty_name, is_internal=False, merchant_category_code=None, amount=None):
+    """Rule-based categorization with MCC fallback."""
+    if is_internal:
+        return 'Internal Transfer'
+
+    combined = f"{description or ''} {counterparty_name or ''}".strip().lower()
+    try:
+        amount_value = 0.0 if amount is None else float(amount)
+    except (TypeError, ValueError):
+        amount_value = 0.0
+
+    mcc = str(merchant_category_code or '').strip()
+    if mcc:
+        mcc_category = MCC_CATEGORY_MAP.get(mcc)
+        if mcc_category:
+            return mcc_category
+
+    if amount_value > 0:
+        income_category = match_category_keywords(
+            _INCOME_KEYWORD_CATEGORIES, combined, _INCOME_KEYWORD_AUTOMATON
+        )
+        if income_category:
+            return income_category
+
+    return match_category_keywords(_KEYWORD_CATEGORIES, combined, _KEYWORD_AUTOMATON) or 'Overig'
+
+def summarize_transaction_stats(rows, etag_seed=''):
+    """
+    One pass over iter_transaction_stats rows: count, income, expenses, per-category expense totals,
+    and a strong ETag over `etag_seed` plus the (account, payment) ids seen, in order.
+    """
+    count = 0
+    income = 0
+    expense_sum = 0
+    category_totals = defaultdict(float)
+    digest = hashlib.blake2b(etag_seed.encode(), digest_size=8)
+    for account_id, payment_id, amount, category, _ in rows:
+        count += 1
+        digest.update(f"{account_id}:{payment_id},".encode())
+        if amount > 0:
+            income += amount
+        elif amount < 0:
+            expense_sum += amount
+            category_totals[category] -= amount
+    return count, income, abs(expense_sum), dict(category_totals), digest.hexdigest()
 
 @app.route('/api/statistics', methods=['GET'])
 @requires_auth
@@ -3343,7 +3910,7 @@ def categorize_transaction(description, counterparty_name, is_internal=False, me
 def get_statistics():
     """Get aggregated statistics - SESSION AUTH REQUIRED"""
     if not API_KEY:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Demo mode - configure API key'
         }), 503
@@ -3354,45 +3921,42 @@ def get_statistics():
         exclude_internal = parse_bool(request.args.get('exclude_internal'), default=False)
         
         cache_key = make_cache_key('statistics')
-        if cache_allowed():
-            cached = cache.get(cache_key)
-            if cached:
-                return jsonify(cached)
+        cached = cached_json_response(cache_key)
+        if cached is not None:
+            return cached
         
-        accounts = list_monetary_accounts()
+        accounts = cached_account_lookup('monetary_accounts', list_monetary_accounts, cache_read_allowed())
         own_ibans = extract_own_ibans(accounts)
-        all_transactions = []
-        
-        for account in accounts:
-            account_id_value = get_obj_field(account, 'id_', 'id')
-            transactions = get_account_transactions(
-                account_id_value,
-                cutoff_date,
-                True,
-                own_ibans,
-                get_obj_field(account, 'description', 'display_name')
-            )
-            all_transactions.extend(transactions)
+        rows = iter_transaction_stats(
+            accounts,
+            cutoff_date,
+            own_ibans,
+            use_cache=cache_read_allowed()
+        )
         
         if exclude_internal:
-            all_transactions = [t for t in all_transactions if not t.get('is_internal_transfer')]
+            rows = (row for row in rows if not row[4])
+        
+        # Payments are immutable, so the included payment ids version the aggregate; the seed adds
+        # what else shapes the body (period, filter, own IBANs behind the internal-transfer flag).
+        # An unchanged representation is answered 304 without serializing.
+        etag_seed = f"{days}|{int(exclude_internal)}|{','.join(sorted(own_ibans))}|"
+        total_transactions, income, expenses, category_totals, etag = summarize_transaction_stats(
+            rows,
+            etag_seed
+        )
+        not_modified = not_modified_response(etag)
+        if not_modified is not None:
+            return not_modified
         
-        income = sum(t['amount'] for t in all_transactions if t['amount'] > 0)
-        expenses = abs(sum(t['amount'] for t in all_transactions if t['amount'] < 0))
         net_savings = income - expenses
         savings_rate = (net_savings / income * 100) if income > 0 else 0
         
-        category_totals = {}
-        for t in all_transactions:
-            if t['amount'] < 0:
-                cat = t['category']
-                category_totals[cat] = category_totals.get(cat, 0) + abs(t['amount'])
-        
         response = {
             'success': True,
             'data': {
                 'period_days': days,
-                'total_transactions': len(all_transactions),
+                'total_transactions': total_transactions,
                 'income': income,
                 'expenses': expenses,
                 'net_savings': net_savings,
@@ -3402,14 +3966,11 @@ def get_statistics():
             }
         }
         
-        if cache_allowed():
-            cache.set(cache_key, response, timeout=CACHE_TTL_SECONDS)
-        
-        return jsonify(response)
+        return cache_json_response(cache_key, response, etag=etag)
         
     except Exception as e:
         logger.exception(f"❌ Error fetching statistics: {e}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(e)
         }), 500
@@ -3420,7 +3981,7 @@ def get_statistics():
 def get_balance_history():
     """Return historical balance series from local data store."""
     if not DATA_DB_ENABLED:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Historical data store disabled'
         }), 503
@@ -3429,7 +3990,7 @@ def get_balance_history():
     start_date = (datetime.now(timezone.utc).date() - timedelta(days=days)).isoformat()
     connection = get_data_db_connection()
     if connection is None:
-        return jsonify({
+        return json_response({
             'success': False,
             'error': 'Unable to open historical data store'
         }), 500
@@ -3528,7 +4089,7 @@ def get_balance_history():
             ).fetchone()
             missing_fx_count = int(row['missing_fx']) if row else 0
 
-        return jsonify({
+        return conditional_json_response({
             'success': True,
             'data': {
                 'days': days,
@@ -3543,20 +4104,19 @@ def get_balance_history():
 
     except Exception as exc:
         logger.exception(f"❌ Error fetching balance history: {exc}")
-        return jsonify({
+        return json_response({
             'success': False,
             'error': str(exc)
         }), 500
     finally:
         connection.close()
 
-@app.route('/api/demo-data', methods=['GET'])
-def get_demo_data():
-    """Get demo data - NO AUTH for testing"""
-    import random
-    from datetime import timedelta
-    
-    days = int(request.args.get('days', 90))
+@lru_cache(maxsize=8)
+def build_demo_payload(days, generated_on):
+    """
+    Serialized demo payload for `days`, built once per day.
+    `generated_on` (a date) is only part of the cache key, so the demo dates roll over daily.
+    """
     categories = ['Boodschappen', 'Horeca', 'Vervoer', 'Wonen', 'Shopping', 'Entertainment']
     merchants = {
         'Boodschappen': ['Albert Heijn', 'Jumbo', 'Lidl'],
@@ -3567,38 +4127,131 @@ def get_demo_data():
         'Entertainment': ['Netflix', 'Spotify']
     }
     
-    transactions = []
-    for i in range(days * 3):
-        category = random.choice(categories)
-        merchant = random.choice(merchants[category])
-        amount = -random.randint(10, 100) if category != 'Wonen' else -850
-        
-        transactions.append({
+    # Draw all random columns up front; the row loop below only assembles dicts.
+    # (category, merchant) pairs weighted 1/len(merchants) keep "uniform category, then uniform merchant".
+    now = datetime.now()
+    count = days * 3
+    day_dates = [(now - timedelta(days=day_offset)).isoformat() for day_offset in range(days + 1)]
+    merchant_pairs = [
+        (category, merchant, f'{category} - {merchant}')
+        for category in categories
+        for merchant in merchants[category]
+    ]
+    pair_weights = [1 / len(merchants[category]) for category, _, _ in merchant_pairs]
+    sampled_pairs = random.choices(merchant_pairs, weights=pair_weights, k=count)
+    sampled_dates = random.choices(day_dates, k=count)
+    sampled_amounts = random.choices(range(10, 101), k=count)
+
+    transactions = [
+        {
             'id': i,
-            'date': (datetime.now() - timedelta(days=random.randint(0, days))).isoformat(),
-            'amount': amount,
+            'date': date,
+            'amount': -amount if category != 'Wonen' else -850,
             'category': category,
             'merchant': merchant,
-            'description': f'{category} - {merchant}'
-        })
+            'description': description
+        }
+        for i, ((category, merchant, description), date, amount) in enumerate(
+            zip(sampled_pairs, sampled_dates, sampled_amounts)
+        )
+    ]
     
     for i in range(days // 30):
         transactions.append({
             'id': len(transactions),
-            'date': (datetime.now() - timedelta(days=i * 30)).isoformat(),
+            'date': day_dates[i * 30],
             'amount': 2800,
             'category': 'Salaris',
             'merchant': 'Werkgever B.V.',
             'description': 'Salary'
         })
     
-    return jsonify({
+    return orjson.dumps({
         'success': True,
         'data': transactions,
         'count': len(transactions),
         'note': 'Demo data - no authentication required'
     })
 
+@app.route('/api/demo-data', methods=['GET'])
+def get_demo_data():
+    """Get demo data - NO AUTH for testing"""
+    days = clamp_days(request.args.get('days', 90))
+    return app.response_class(
+        build_demo_payload(days, datetime.now().date()),
+        mimetype='application/json'
+    )
+
+BATCH_MAX_REQUESTS = 10
+BATCH_EXCLUDED_PREFIXES = ('/api/auth/', '/api/batch')
+
+def dispatch_batch_get(path):
+    """Run one GET /api/* path in-process with the caller's session cookie and client address."""
+    if not isinstance(path, str):
+        return {'path': path, 'status': 400, 'body': {'success': False, 'error': 'Path must be a string'}}
+
+    parts = urlsplit(path)
+    # Routing sees the percent-decoded path, so the allow-list must check that same value.
+    route_path = unquote(parts.path)
+    if (
+        parts.scheme or parts.netloc
+        or not route_path.startswith('/api/')
+        or route_path.startswith(BATCH_EXCLUDED_PREFIXES)
+        or any(segment in ('.', '..') for segment in route_path.split('/'))
+    ):
+        return {'path': path, 'status': 400, 'body': {'success': False, 'error': 'Path not allowed in batch'}}
+
+    headers = {}
+    if request.headers.get('Cookie'):
+        headers['Cookie'] = request.headers['Cookie']
+
+    # Re-quoted so the request context's single decode yields exactly the checked route_path.
+    with app.test_request_context(
+        quote(route_path, safe='/'),
+        method='GET',
+        query_string=parts.query,
+        headers=headers,
+        environ_overrides={
+            'REMOTE_ADDR': request.remote_addr or '',
+            BATCH_DISPATCH_ENVIRON_KEY: True
+        }
+    ):
+        response = app.full_dispatch_request()
+        body = response.get_json(silent=True)
+
+    return {'path': path, 'status': response.status_code, 'body': body}
+
+@app.route('/api/batch', methods=['POST'])
+@requires_auth
+def batch_requests():
+    """
+    Run several read-only API GETs in one round trip - SESSION AUTH REQUIRED
+    Body: {"requests": ["/api/accounts", "/api/history/balances?days=90"]}
+    Costs one 'general' rate-limit token per sub-request, charged up front (all or nothing).
+    """
+    payload = request.get_json(silent=True) or {}
+    paths = payload.get('requests') if isinstance(payload, dict) else payload
+    valid = isinstance(paths, list) and 0 < len(paths) <= BATCH_MAX_REQUESTS
+    if not rate_limiter.is_allowed(request.remote_addr, 'general', cost=len(paths) if valid else 1):
+        return rate_limit_exceeded_response(request.remote_addr, 'general')
+    if not isinstance(paths, list) or not paths:
+        return json_response({
+            'success': False,
+            'error': 'Body must contain a non-empty "requests" list'
+        }), 400
+    if len(paths) > BATCH_MAX_REQUESTS:
+        return json_response({
+            'success': False,
+            'error': f'At most {BATCH_MAX_REQUESTS} requests per batch'
+        }), 400
+
+    results = [dispatch_batch_get(path) for path in paths]
+    return json_response({
+        'success': True,
+        'data': results,
+        'count': len(results)
+    })
+
 if __name__ == '__main__':
     print("🚀 Starting Bunq Dashboard API (SESSION-BASED AUTH)...")
     print(f"📡 Environment: {ENVIRONMENT_LABEL}")
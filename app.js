@@ -224,6 +224,28 @@ async function logout() {
     }
 }
 
+/**
+ * Shared 401/429 handling for direct responses and /api/batch sub-results.
+ * Returns true when the status was handled (login modal or rate-limit error shown).
+ */
+function handleApiErrorStatus(status, data) {
+    if (status === 401 && data && data.login_required) {
+        console.error('🔒 Session expired or not authenticated');
+        isAuthenticated = false;
+        updateAuthUI(false);
+        showLoginModal();
+        return true;
+    }
+    
+    if (status === 429) {
+        console.error('⏱️ Rate limit exceeded');
+        showError('Too many requests. Please wait a minute.');
+        return true;
+    }
+    
+    return false;
+}
+
 /**
  * Make authenticated API request (with session cookie)
  */
@@ -248,24 +270,13 @@ async function authenticatedFetch(url, options = {}) {
         const response = await fetch(url, mergedOptions);
         
         // Check for authentication errors
-        if (response.status === 401) {
-            const data = await response.json();
-            
-            if (data.login_required) {
-                console.error('🔒 Session expired or not authenticated');
-                isAuthenticated = false;
-                updateAuthUI(false);
-                showLoginModal();
+        if (response.status === 401 || response.status === 429) {
+            const data = response.status === 401 ? await response.json() : null;
+            if (handleApiErrorStatus(response.status, data)) {
                 return null;
             }
         }
         
-        if (response.status === 429) {
-            console.error('⏱️ Rate limit exceeded');
-            showError('Too many requests. Please wait a minute.');
-            return null;
-        }
-        
         if (!response.ok) {
             throw new Error(`HTTP ${response.status}`);
         }
@@ -323,11 +334,24 @@ async function loadAccounts() {
         return;
     }
     
-    const response = await authenticatedFetch(`${CONFIG.apiEndpoint}/accounts`);
+    // Accounts and balance history are independent: fetch both in one round trip.
+    const batch = await authenticatedFetch(`${CONFIG.apiEndpoint}/batch`, {
+        method: 'POST',
+        body: JSON.stringify({
+            requests: ['/api/accounts', `/api/history/balances?days=${CONFIG.timeRange}`]
+        })
+    });
+    const [accountsResult, historyResult] = (batch && batch.success && batch.data) || [];
+    const response = accountsResult && accountsResult.body;
+    if (accountsResult && accountsResult.status >= 400
+        && !handleApiErrorStatus(accountsResult.status, response)) {
+        showError(`Request failed: HTTP ${accountsResult.status}`);
+    }
     if (response && response.success) {
         accountsList = response.data || [];
         renderAccountsFilter(accountsList);
-        await loadBalanceHistory(CONFIG.timeRange);
+        const history = historyResult && historyResult.body;
+        balanceHistoryData = (history && history.success && history.data) || null;
     } else {
         accountsList = [];
         balanceHistoryData = null;
@@ -335,33 +359,6 @@ async function loadAccounts() {
     }
 }
 
-async function loadBalanceHistory(days = CONFIG.timeRange) {
-    if (!isAuthenticated) {
-        balanceHistoryData = null;
-        return null;
-    }
-
-    try {
-        const response = await fetch(`${CONFIG.apiEndpoint}/history/balances?days=${days}`, {
-            credentials: 'include'
-        });
-        if (!response.ok) {
-            balanceHistoryData = null;
-            return null;
-        }
-        const payload = await response.json();
-        if (payload && payload.success && payload.data) {
-            balanceHistoryData = payload.data;
-            return balanceHistoryData;
-        }
-    } catch (error) {
-        console.warn('Unable to load balance history:', error);
-    }
-
-    balanceHistoryData = null;
-    return null;
-}
-
 async function loadDataQuality(days = CONFIG.timeRange) {
     if (!isAuthenticated) {
         dataQualitySummary = null;
@@ -0,0 +1,31 @@
+"""
+Gunicorn config for the Bunq Dashboard container (local dev can still use `python api_proxy.py`).
+Run: gunicorn -c gunicorn_conf.py api_proxy:app
+"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# One process keeps the in-memory caches and rate limiter coherent; threads cover the Bunq I/O waits.
+# More workers require a fixed FLASK_SECRET_KEY, otherwise each worker signs sessions with its own key.
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Keep idle client / reverse-proxy connections open instead of a new TCP (+TLS) handshake per poll.
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', '30'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+
+accesslog = None
+errorlog = '-'
+
+
+def post_worker_init(worker):
+    """Each worker loads its own Bunq context (same as the __main__ startup path)."""
+    from api_proxy import init_bunq
+
+    if init_bunq():
+        worker.log.info("✅ Bunq API initialized")
+    else:
+        worker.log.warning("⚠️ Running in demo mode only")